@@ -77,6 +77,18 @@ def get_app_tasks(tasks, all_tasks=None):
     return [get_app_task(task, all_tasks) for task in tasks]
 
 
+def build_chain(inject_args, tasks):
+    # Build the chain in one go; composing with |= re-clones the whole chain for every task.
+    signatures = [task.s() for task in tasks]
+    if len(signatures) == 1:
+        # a single service is enqueued as a plain signature, not a one-task chain
+        return inject_args | signatures[0]
+
+    from celery import chain
+    from firexapp.engine.celery import app
+    return inject_args | chain(*signatures, app=app)
+
+
 class JsonContentNotList(Exception):
     pass
 
@@ -178,14 +178,13 @@ def create_link(src, target, delete_link=None, relative=False, create_target_dir
     # If we want to delete the link, we do a link-replace in an atomic manner
     temp_target = target + f'.{get_native_id()}.tmp'
     try:
-        # Avoid errors with possibly stale links
-        os.remove(temp_target)
-    except FileNotFoundError:
-        pass
-
-    try:
-        os.symlink(src, temp_target)
-        os.rename(temp_target, target)
+        try:
+            os.symlink(src, temp_target)
+        except FileExistsError:
+            # Avoid errors with possibly stale links
+            os.remove(temp_target)
+            os.symlink(src, temp_target)
+        os.replace(temp_target, target)
         logger.debug('Symbolic link created: %s -> %s' % (src, target))
     except Exception:
         try:
@@ -1,7 +1,7 @@
 import os
 import sys
 import logging
-from collections import OrderedDict, namedtuple
+from collections import namedtuple
 from typing import Dict, List, Tuple
 
 from entrypoints import EntryPoint
@@ -37,14 +37,13 @@ def _get_paths_without_cwd() -> [str]:
 #   to be found twice.
 #
 def prune_duplicate_module_entry_points(entry_points) -> [EntryPoint]:
-    id_to_entry_points = OrderedDict()
+    id_to_entry_points = {}
 
     for e in entry_points:
         key = (e.name, e.module_name, e.object_name)
-        if key not in id_to_entry_points:
-            id_to_entry_points[key] = e
+        stored = id_to_entry_points.get(key)
         # Replace the currently stored entry point for this key if the distro is None.
-        elif id_to_entry_points[key].distro is None and e.distro is not None:
+        if stored is None or (stored.distro is None and e.distro is not None):
             id_to_entry_points[key] = e
 
     return list(id_to_entry_points.values())
@@ -2,7 +2,7 @@ import os
 import sys
 import re
 from firexkit.argument_conversion import ConverterRegister
-from typing import Union
+from typing import Iterable, Union
 from firexapp.submit.console import setup_console_logging
 
 
@@ -148,11 +148,26 @@ class InputConverter:
         if pre_load and cls.pre_load_was_run:
                 raise Exception("Pre-microservice conversion was already run")
 
-        ret = cls.instance().convert(pre_task=pre_load, **kwargs)
+        if cls.has_converters(pre_load):
+            ret = cls.instance().convert(pre_task=pre_load, **kwargs)
+        else:
+            # Nothing registered for this pass; conversion would leave the arguments unchanged.
+            ret = kwargs
 
         cls.pre_load_was_run = True
         return ret
 
+    @classmethod
+    def has_converters(cls, pre_load=None) -> bool:
+        """
+        Whether any converter is registered for the pre-microservice load conversion, or the post-load one.
+
+        :param pre_load: defaults to the conversion that would run next
+        """
+        pre_load = not cls.pre_load_was_run if pre_load is None else pre_load
+        register = cls.instance()
+        return bool(register._pre_converters if pre_load else register._post_converters)
+
 @InputConverter.register
 def convert_booleans(kwargs):
     """Converts standard true/false/none values to bools and None"""
@@ -205,7 +220,7 @@ def whitelist_arguments(argument_list: Union[str, list]):
     _global_argument_whitelist |= set(argument_list)
 
 
-def find_unused_arguments(chain_args: {}, ignore_list: [], all_tasks: []):
+def find_unused_arguments(chain_args: {}, ignore_list: Iterable[str], all_tasks: []):
     """
     Function to detect any arguments that are not explicitly consumed by any microservice.
 
@@ -213,55 +228,46 @@ def find_unused_arguments(chain_args: {}, ignore_list: [], all_tasks: []):
 
     :param chain_args: The dictionary of chain args to check
     :type chain_args: dict
-    :param ignore_list: A list of exception arguments that are acceptable. This usually includes application args.
-    :type ignore_list: list
+    :param ignore_list: Exception arguments that are acceptable. This usually includes application args.
+    :type ignore_list: list or set
     :param all_tasks: A list of all microservices. Usually app.tasks
     :return: A dictionary of un-applicable arguments
     """
-    import Levenshtein as Lev
-
     if len(chain_args) == 0:
         return {}, {}
 
-    ignore_list += _global_argument_whitelist
-
-    # remove any whitelisted
-    unused_chain_args = chain_args.copy()
-    for std_arg in ignore_list:
-        if std_arg in unused_chain_args:
-            unused_chain_args.pop(std_arg)
+    ignored_args = _global_argument_whitelist.union(ignore_list)
 
-    # build up used chain arg list
-    used_chain_args = []
+    # build up used chain args, de-duplicated but kept in task order
+    used_chain_args = {}
     for _, task in all_tasks.items():
-        used_chain_args.extend(getattr(task, "required_args", []))
-        used_chain_args.extend(getattr(task, "optional_args", []))
+        used_chain_args.update(dict.fromkeys(getattr(task, "required_args", [])))
+        used_chain_args.update(dict.fromkeys(getattr(task, "optional_args", [])))
 
-    # Loop through used args and remove any found in unused list
-    for used_arg in used_chain_args:
-        if used_arg in unused_chain_args:
-            unused_chain_args.pop(used_arg)
+    # remove any whitelisted or used
+    unused_chain_args = {k: v for k, v in chain_args.items()
+                         if k not in ignored_args and k not in used_chain_args}
+    if not unused_chain_args:
+        return unused_chain_args, {}
+
+    # only needed to suggest near matches, so not imported when every argument is used
+    from rapidfuzz import process
+    from rapidfuzz.distance import Indel, Levenshtein
 
     # Loop through remaining unused chain args and build near-match dict
+    candidates = list(used_chain_args)
     close_matches = {}
     for unused_arg in unused_chain_args:
-        close_match = {}
-        for used_arg in used_chain_args:
-            # for unused args less than 10 chars long, use distance method, otherwise use ratio method.
-            if len(unused_arg) < 10:
-                distance = Lev.distance(used_arg, unused_arg)
-                if distance < 3:
-                    if not close_match or close_match['distance'] > distance:
-                        close_match['arg'] = used_arg
-                        close_match['distance'] = distance
-            else:
-                match_ratio = Lev.ratio(used_arg, unused_arg)
-                if match_ratio > 0.9:
-                    if not close_match or close_match['ratio'] < match_ratio:
-                        close_match['arg'] = used_arg
-                        close_match['ratio'] = match_ratio
+        # for unused args less than 10 chars long, use distance method, otherwise use ratio method.
+        if len(unused_arg) < 10:
+            close_match = process.extractOne(unused_arg, candidates, scorer=Levenshtein.distance, score_cutoff=2)
+        else:
+            close_match = process.extractOne(unused_arg, candidates, scorer=Indel.normalized_similarity,
+                                             score_cutoff=0.9)
+            if close_match and close_match[1] <= 0.9:
+                close_match = None
         # Store the closest match in the returned dict
         if close_match:
-            close_matches[unused_arg] = close_match['arg']
+            close_matches[unused_arg] = close_match[0]
 
     return unused_chain_args, close_matches
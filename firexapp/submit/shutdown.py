@@ -73,19 +73,28 @@ def launch_background_shutdown(logs_dir, reason, celery_shutdown_timeout=DEFAULT
 
 def wait_for_broker_shutdown(broker, timeout=15, force_kill=True):
     logger.debug("Waiting for broker to shut down")
-    shutdown_wait_time = time.time() + timeout
-    while time.time() < shutdown_wait_time:
-        if not broker.is_alive():
+    # The broker is shut down by another process, so poll it, backing off exponentially: a quick shutdown is
+    # noticed within milliseconds, while a slow one doesn't incur constant wake-ups.
+    shutdown_wait_time = time.monotonic() + timeout
+    poll_interval = 0.01
+    alive = broker.is_alive()
+    while alive:
+        remaining = shutdown_wait_time - time.monotonic()
+        if remaining <= 0:
             break
-        time.sleep(0.1)
+        time.sleep(min(poll_interval, remaining))
+        poll_interval = min(poll_interval * 2, 1)
+        alive = broker.is_alive()
 
-    if not broker.is_alive():
+    if not alive:
         logger.debug("Confirmed successful graceful broker shutdown.")
-    elif force_kill:
+        return True
+
+    if force_kill:
         logger.debug(f"Warning! Broker was not shut down after {timeout} seconds. FORCE KILLING BROKER.")
         broker.force_kill()
-
-    return not broker.is_alive()
+        return not broker.is_alive()
+    return False
 
 
 def _inspect_broker_safe(inspect_fn, broker, celery_app, **kwargs):
@@ -147,10 +156,12 @@ def revoke_active_tasks(broker, celery_app,  max_revoke_retries=5, task_predicat
             logger.warning(f"Found {len(maybe_active_tasks.active_tasks)} active tasks after revoke. Revoking active tasks again.")
 
         # Revoke tasks in order they were started. This avoids ChainRevokedException errors when children are revoked
-        # before their parents.
-        for task in sorted(maybe_active_tasks.active_tasks, key=lambda t: t.get('time_start', float('inf'))):
-            logger.info(f"Revoking {task['name']}[{task['id']}]")
-            celery_app.control.revoke(task_id=task["id"], terminate=True)
+        # before their parents. Workers don't preserve the order of ids given to a single revoke, so each task gets
+        # its own broadcast, but all broadcasts share one broker connection.
+        with celery_app.connection_for_write() as connection:
+            for task in sorted(maybe_active_tasks.active_tasks, key=lambda t: t.get('time_start', float('inf'))):
+                logger.info(f"Revoking {task['name']}[{task['id']}]")
+                celery_app.control.revoke(task_id=task["id"], terminate=True, connection=connection)
 
         # wait for confirmation of revoke
         maybe_active_tasks = _tasks_from_active(get_active_broker_safe(broker, celery_app), task_predicate)
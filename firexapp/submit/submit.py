@@ -1,4 +1,3 @@
-import multiprocessing
 import pathlib
 import re
 import sys
@@ -11,12 +10,14 @@ import traceback
 from getpass import getuser
 import socket
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from celery.signals import worker_ready
 from shutil import copyfile
 from contextlib import contextmanager
 
-from celery.exceptions import NotRegistered
+from celery.backends.redis import RedisBackend
+from celery.exceptions import NotRegistered, BackendStoreError
 from firexapp.discovery import get_all_pkg_versions_str
 from firexapp.engine.default_celery_config import primary_worker_minimum_concurrency
 from firexapp.engine.logging import add_hostname_to_log_records
@@ -28,14 +29,17 @@ from firexkit.chain import InjectArgs, verify_chain_arguments, InvalidChainArgsE
 from firexapp.fileregistry import FileRegistry
 from firexapp.submit.uid import Uid
 from firexapp.submit.arguments import InputConverter, ChainArgException, get_chain_args, find_unused_arguments
-from firexapp.submit.tracking_service import get_tracking_services, get_service_name
+from firexapp.submit.tracking_service import get_tracking_services, get_service_name, \
+    PARALLEL_TRACKING_START_ENV_NAME
 from firexapp.plugins import plugin_support_parser
 from firexapp.submit.console import setup_console_logging
 from firexapp.application import (
-    import_microservices, get_app_tasks, get_app_task, JSON_ARGS_PATH_ARG_NAME, RECEIVED_SIGNAL_MSG_PREFIX
+    import_microservices, get_app_tasks, get_app_task, build_chain, JSON_ARGS_PATH_ARG_NAME,
+    RECEIVED_SIGNAL_MSG_PREFIX
 )
 from firexapp.engine.celery import app
 from firexapp.broker_manager.broker_factory import BrokerFactory
+from firexapp.celery_manager import CeleryManager
 from firexapp.submit.shutdown import launch_background_shutdown, DEFAULT_CELERY_SHUTDOWN_TIMEOUT
 from firexapp.submit.install_configs import load_new_install_configs, FireXInstallConfigs, INSTALL_CONFIGS_ENV_NAME
 from firexapp.submit.arguments import whitelist_arguments
@@ -56,6 +60,7 @@ RUN_COMPLETE_REGISTRY_KEY = 'RUN_COMPLETE_REGISTRY_KEY'
 FileRegistry().register_file(RUN_COMPLETE_REGISTRY_KEY, os.path.join(Uid.debug_dirname, 'RUN_COMPLETE'))
 
 RUN_SOFT_TIME_LIMIT_KEY = 'run_soft_time_limit'
+CPU_COUNT = os.cpu_count() or 1
 ASYNC_SHUTDOWN_CELERY_EVENT_TYPE = 'firex-async-shutdown'
 
 class JsonFileAction(argparse.Action):
@@ -118,6 +123,44 @@ def _safe_send_async_shutdown_if_signal(reason: Optional[str]) -> None:
             logger.debug(f'Failed to send {ASYNC_SHUTDOWN_CELERY_EVENT_TYPE} event: {ex}')
 
 
+def backend_set_many(backend, key_values: dict) -> None:
+    # Equivalent to backend.set() for each item, but in a single round-trip when the backend is Redis.
+    if not isinstance(backend, RedisBackend):
+        for k, v in key_values.items():
+            backend.set(k, v)
+        return
+
+    for v in key_values.values():
+        # same limit as RedisBackend.set, checked before anything is written
+        if isinstance(v, str) and len(v) > backend._MAX_STR_VALUE_SIZE:
+            raise BackendStoreError('value too large for Redis backend')
+
+    def _set_many():
+        with backend.client.pipeline() as pipe:
+            for k, v in key_values.items():
+                if backend.expires:
+                    pipe.setex(k, backend.expires, v)
+                else:
+                    pipe.set(k, v)
+                pipe.publish(k, v)
+            pipe.execute()
+
+    backend.ensure(_set_many, ())
+
+
+def write_json_object_items(fp, items) -> None:
+    # Write (key, value) string pairs to a binary file as an indented JSON object, one item at a time, so
+    # that no intermediate copy of the data is built. The items are written in the order given.
+    first = True
+    for k, v in items:
+        fp.write(b'{\n    ' if first else b',\n    ')
+        fp.write(json.dumps(k).encode())
+        fp.write(b': ')
+        fp.write(json.dumps(v).encode())
+        first = False
+    fp.write(b'{}' if first else b'\n}')
+
+
 def safe_create_initial_run_json(**kwargs):
     try:
         FireXJsonReportGenerator.create_initial_run_json(**kwargs)
@@ -128,6 +171,10 @@ def safe_create_initial_run_json(**kwargs):
 class SubmitBaseApp:
     SUBMISSION_LOGGING_FORMATTER = '[%(asctime)s %(levelname)s] %(message)s'
     DEFAULT_MICROSERVICE = None
+    TRACKING_SERVICES_MIN_POLL_INTERVAL = 0.025
+    TRACKING_SERVICES_MAX_POLL_INTERVAL = 1.0
+    # Celery autoscales up to this many worker slots per CPU, unless --celery_concurrency is given.
+    CELERY_AUTOSCALE_MAX_PER_CPU = 8
 
     install_configs: FireXInstallConfigs
 
@@ -143,6 +190,8 @@ class SubmitBaseApp:
         self.submit_args = None
         self.submit_parser = None
         self.arg_parser = None
+        self._submission_log_path = None
+        self._submission_log_copied_stat = None
 
     def store_parser_attributes(self, arg_parser, submit_parser):
         # Only need to store these so that resolve_install_configs_args can operate on them
@@ -167,8 +216,20 @@ class SubmitBaseApp:
         self.log_preamble()
 
     def copy_submission_log(self):
-        if self.submission_tmp_file and os.path.isfile(self.submission_tmp_file) and self.uid:
-            copyfile(self.submission_tmp_file, FileRegistry().get_file(SUBMISSION_FILE_REGISTRY_KEY, self.uid.logs_dir))
+        if not self.submission_tmp_file or not self.uid:
+            return
+        try:
+            st = os.stat(self.submission_tmp_file)
+        except OSError:
+            return
+        # this gets copied several times per submission; skip the copy if nothing was logged since the last one
+        copied_stat = (st.st_size, st.st_mtime_ns)
+        if copied_stat == self._submission_log_copied_stat:
+            return
+        if self._submission_log_path is None:
+            self._submission_log_path = FileRegistry().get_file(SUBMISSION_FILE_REGISTRY_KEY, self.uid.logs_dir)
+        copyfile(self.submission_tmp_file, self._submission_log_path)
+        self._submission_log_copied_stat = copied_stat
 
     def log_preamble(self):
         """Overridable method to allow a firex application to log on startup"""
@@ -244,11 +305,8 @@ class SubmitBaseApp:
 
         banner_title = ' %s ' % banner_title
 
-        sep_len = len(banner_title) + 6
-        err_msg = err_msg.split('\n')
-        for l in err_msg:
-            if len(l) > sep_len:
-                sep_len = len(l)
+        err_msg = err_msg.splitlines()
+        sep_len = max(len(banner_title) + 6, max(map(len, err_msg), default=0))
 
         top_sep_len = int((sep_len - len(banner_title) + 1) / 2)
         top_banner = '*' * top_sep_len + banner_title + '*' * top_sep_len
@@ -377,14 +435,13 @@ class SubmitBaseApp:
 
     def dump_environ(self):
         # Mask  any password-related env vars before dumping them in the environ.json
-        copy_of_os_environ = os.environ.copy()
-        for k in copy_of_os_environ:
-            if any(e in k.lower() for e in ['passwd', 'password']):
-                copy_of_os_environ[k] = '********'
+        environ_items = ((k, '********' if any(e in k.lower() for e in ['passwd', 'password']) else v)
+                         for k, v in sorted(os.environ.items()))
 
         # Create an env file for debugging
-        with open(FileRegistry().get_file(ENVIRON_FILE_REGISTRY_KEY, self.uid.logs_dir), 'w') as f:
-            json.dump(copy_of_os_environ, fp=f, skipkeys=True, sort_keys=True, indent=4)
+        with open(FileRegistry().get_file(ENVIRON_FILE_REGISTRY_KEY, self.uid.logs_dir), 'wb',
+                  buffering=65536) as f:
+            write_json_object_items(f, environ_items)
 
     def check_for_failures(self, root_task_result_promise, unsuccessful_services):
         if unsuccessful_services:
@@ -392,7 +449,6 @@ class SubmitBaseApp:
             raise FireXReturnCodeException(msg, rc)
 
     def set_broker_in_app(self):
-        from firexapp.engine.celery import app
         broker_url = self.broker.get_url()
         BrokerFactory.set_broker_env(broker_url)
 
@@ -407,11 +463,12 @@ class SubmitBaseApp:
 
         try:
             # start backend
-            app.backend.set('uid', str(uid))
-            app.backend.set('logs_dir', uid.logs_dir)
-            app.backend.set('resources_dir', uid.resources_dir)
+            backend_values = {'uid': str(uid),
+                              'logs_dir': uid.logs_dir,
+                              'resources_dir': uid.resources_dir}
             if args.soft_time_limit:
-                app.backend.set(RUN_SOFT_TIME_LIMIT_KEY, args.soft_time_limit)
+                backend_values[RUN_SOFT_TIME_LIMIT_KEY] = args.soft_time_limit
+            backend_set_many(app.backend, backend_values)
 
             # IMPORT ALL THE MICROSERVICES
             # ONLY AFTER BROKER HAD STARTED
@@ -447,9 +504,7 @@ class SubmitBaseApp:
             sys.exit(-1)
 
         # validate that all necessary chain args were provided
-        c = InjectArgs(**chain_args)
-        for t in app_tasks:
-            c |= t.s()
+        c = build_chain(InjectArgs(**chain_args), app_tasks)
         try:
             verify_chain_arguments(c)
         except InvalidChainArgsException as e:
@@ -467,10 +522,9 @@ class SubmitBaseApp:
         return chain_args
 
     def start_celery(self, args, plugins):
-        from firexapp.celery_manager import CeleryManager
         celery_manager = CeleryManager(logs_dir=self.uid.logs_dir, plugins=plugins)
         auto_scale_min = primary_worker_minimum_concurrency
-        auto_scale_max = multiprocessing.cpu_count()*8
+        auto_scale_max = CPU_COUNT * self.CELERY_AUTOSCALE_MAX_PER_CPU
         celery_manager.start(workername=app.conf.primary_worker_name,
                              wait=True,
                              concurrency=args.celery_concurrency,
@@ -502,7 +556,6 @@ class SubmitBaseApp:
         return chain_args
 
     def start_broker(self, args):
-        from firexapp.broker_manager.broker_factory import BrokerFactory
         self.broker = BrokerFactory.create_new_broker_manager(logs_dir=self.uid.logs_dir)
         self.broker.start(save_db=args.save_redis_db)
 
@@ -511,7 +564,9 @@ class SubmitBaseApp:
         self.enabled_tracking_services = []
         services = get_tracking_services()
         if services:
-            logger.debug("Tracking services:")
+            log_details = logger.isEnabledFor(logging.DEBUG)
+            if log_details:
+                logger.debug("Tracking services:")
             cli_disabled_service_names = args.disable_tracking_services.split(',')
             requested_service_names = self.install_configs.raw_configs.requested_tracking_services
             for service in services:
@@ -520,14 +575,15 @@ class SubmitBaseApp:
                 # requested_service_names being None means "load all installed".
                 is_requested = requested_service_names is None or service_name in requested_service_names
 
-                detail = f'v{service.get_pkg_version_info()}'
-                if not is_requested:
-                    detail += ' (not requested via install_config)'
-                elif is_cli_disabled:
-                    detail += ' (CLI disabled)'
-                else:
-                    detail += ' '
-                logger.debug(f"\t{service_name} {detail}")
+                if log_details:
+                    detail = f'v{service.get_pkg_version_info()}'
+                    if not is_requested:
+                        detail += ' (not requested via install_config)'
+                    elif is_cli_disabled:
+                        detail += ' (CLI disabled)'
+                    else:
+                        detail += ' '
+                    logger.debug(f"\t{service_name} {detail}")
                 if is_requested and not is_cli_disabled:
                     self.enabled_tracking_services.append(service)
 
@@ -539,9 +595,19 @@ class SubmitBaseApp:
                 "Missing the following tracking services required by install config. Ensure the pip packages that " \
                 f"contribute these tracking services are installed: {missing_require_services}"
 
+        def start_service(service):
+            return service.start(args, install_configs=self.install_configs, **chain_args)
+
+        if len(self.enabled_tracking_services) > 1 and os.environ.get(PARALLEL_TRACKING_START_ENV_NAME):
+            with ThreadPoolExecutor(max_workers=len(self.enabled_tracking_services),
+                                    thread_name_prefix='tracking_service_start') as executor:
+                extras = list(executor.map(start_service, self.enabled_tracking_services))
+        else:
+            extras = [start_service(service) for service in self.enabled_tracking_services]
+
+        # merged in service order, regardless of how they were started
         additional_chain_args = {}
-        for service in self.enabled_tracking_services:
-            extra = service.start(args, install_configs=self.install_configs, **chain_args)
+        for extra in extras:
             if extra:
                 additional_chain_args.update(extra)
         return additional_chain_args
@@ -551,29 +617,34 @@ class SubmitBaseApp:
             return
 
         services_by_name = {get_service_name(s): s for s in self.enabled_tracking_services}
-        not_passed_pred_services = list(services_by_name.keys())
+        not_passed_pred_services = set(services_by_name)
         start_wait_time = time.time()
         timeout_max = start_wait_time + timeout
+        # Poll quickly at first for fast-starting services, backing off for slow ones.
+        poll_interval = self.TRACKING_SERVICES_MIN_POLL_INTERVAL
 
         while not_passed_pred_services and time.time() < timeout_max:
-            for service_name in not_passed_pred_services:
+            for service_name in list(not_passed_pred_services):
                 if service_predicate(services_by_name[service_name]):
-                    # Service has passed the predicate, remove it from the list of not passed services.
-                    not_passed_pred_services = [n for n in not_passed_pred_services if service_name != n]
-                    if not not_passed_pred_services:
+                    # Service has passed the predicate, remove it from the set of not passed services.
+                    not_passed_pred_services.discard(service_name)
+                    # Give the remaining services a fresh quick probe.
+                    poll_interval = self.TRACKING_SERVICES_MIN_POLL_INTERVAL
+                    if not not_passed_pred_services and logger.isEnabledFor(logging.DEBUG):
                         logger.debug(f"Last tracking service {description} (long pole) is: {service_name}")
             if not_passed_pred_services:
-                time.sleep(0.1)
+                time.sleep(min(poll_interval, max(timeout_max - time.time(), 0)))
+                poll_interval = min(poll_interval * 1.5, self.TRACKING_SERVICES_MAX_POLL_INTERVAL)
 
         if not_passed_pred_services:
             logger.warning(f"The following services are still not {description} after {timeout} secs:")
-            for s in not_passed_pred_services:
+            for s in [n for n in services_by_name if n in not_passed_pred_services]:
                 launch_file = getattr(services_by_name[s], 'stdout_file', None)
                 msg = f'{s}: see {launch_file}' if launch_file else s
                 logger.warning('\t' + msg)
         else:
             wait_duration = time.time() - start_wait_time
-            logger.debug("Waited %.1f secs for tracking services to be %s." % (wait_duration, description))
+            logger.debug("Waited %.1f secs for tracking services to be %s.", wait_duration, description)
 
     def wait_tracking_services_task_ready(self, timeout=5)->None:
         self.wait_tracking_services_pred(lambda s: s.ready_for_tasks(celery_app=app), 'ready for tasks', timeout)
@@ -638,10 +709,12 @@ class SubmitBaseApp:
 
     @classmethod
     def validate_argument_applicability(cls, chain_args, args, all_tasks):
+        if not chain_args:
+            return True
         if isinstance(args, argparse.Namespace):
             args = vars(args)
         if isinstance(args, dict):
-            args = list(args.keys())
+            args = args.keys()
 
         unused_chain_args, matches = find_unused_arguments(chain_args=chain_args,
                                                            ignore_list=args,
@@ -650,12 +723,10 @@ class SubmitBaseApp:
             # everything is used. Good job!
             return True
 
-        logger.error("Invalid arguments provided. The following arguments are not used by any microservices:")
-        for arg in unused_chain_args:
-            if arg in matches:
-                logger.error("--" + arg + " (Did you mean '%s'?)" % matches[arg])
-            else:
-                logger.error("--" + arg)
+        unused_lines = [f"--{arg} (Did you mean '{matches[arg]}'?)" if arg in matches else f"--{arg}"
+                        for arg in unused_chain_args]
+        logger.error("Invalid arguments provided. The following arguments are not used by any microservices:\n%s",
+                     '\n'.join(unused_lines))
         return False
 
     @contextmanager
@@ -680,14 +751,15 @@ def get_log_dir_from_output(cmd_output: str)->str:
     if not cmd_output:
         return ""
 
-    lines = cmd_output.split("\n")
     log_dir_key = "Logs: "
-    try:
-        logs_lines = [line.split(log_dir_key)[1] for line in lines if log_dir_key in line]
-        log_dir_line = logs_lines[-1]
-        return log_dir_line.strip()
-    except IndexError:
+    # only the last line mentioning the logs directory is of interest, so search backwards for it
+    key_index = cmd_output.rfind(log_dir_key)
+    if key_index < 0:
         return ""
+    line_start = cmd_output.rfind("\n", 0, key_index) + 1
+    line_end = cmd_output.find("\n", key_index)
+    line = cmd_output[line_start:line_end if line_end >= 0 else None]
+    return line.split(log_dir_key)[1].strip()
 
 
 class FireXReturnCodeException(Exception):
@@ -1,11 +1,25 @@
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from entrypoints import EntryPoint
+
 from firexapp.discovery import get_firex_tracking_services_entry_points, PkgVersionInfo
 from firexapp.submit.install_configs import FireXInstallConfigs
 
 _services = None
 
+#: Set to load tracking service entry points concurrently (off by default). Their packages must then be safe to import
+#: alongside each other, without import-time side effects that assume single-threaded initialization. The loaded
+#: services keep their entry point order.
+PARALLEL_TRACKING_LOAD_ENV_NAME = 'FIREX_PARALLEL_TRACKING_LOAD'
+
+#: Set to start the enabled tracking services concurrently (off by default). Their start() implementations must then be
+#: safe to run alongside each other. The chain args returned by start() are still merged in service order, so later
+#: services win on conflicting keys exactly as when they are started one at a time.
+PARALLEL_TRACKING_START_ENV_NAME = 'FIREX_PARALLEL_TRACKING_START'
+
 
 class TrackingService(ABC):
 
@@ -32,11 +46,19 @@ def get_service_name(service: TrackingService) -> str:
     return service.__class__.__name__
 
 
+def _load_entry_points(entry_pts) -> list:
+    if len(entry_pts) < 2 or not os.environ.get(PARALLEL_TRACKING_LOAD_ENV_NAME):
+        return [e.load() for e in entry_pts]
+    # Loading imports each service's package, which can be heavy; overlap the imports rather than paying their sum.
+    with ThreadPoolExecutor(max_workers=min(8, len(entry_pts)), thread_name_prefix='tracking_service_load') as ex:
+        return list(ex.map(EntryPoint.load, entry_pts))
+
+
 def get_tracking_services() -> Optional[tuple[TrackingService]]:
     global _services
     if _services is None:
         entry_pts = get_firex_tracking_services_entry_points()
-        entry_objects = [e.load() for e in entry_pts]
+        entry_objects = _load_entry_points(entry_pts)
         _services = tuple([point() for point in entry_objects])
     return _services
 
@@ -47,4 +69,4 @@ def get_tracking_services_versions() -> list[PkgVersionInfo]:
 def has_flame() -> bool:
     # Unfortunate coupling, but just too many things vary depending on presence of flame. Will eventually bring
     # flame in to firexapp.
-    return 'FlameLauncher' in get_tracking_services()
\ No newline at end of file
+    return any(get_service_name(s) == 'FlameLauncher' for s in get_tracking_services())
\ No newline at end of file
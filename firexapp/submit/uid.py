@@ -1,7 +1,7 @@
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 import os
 import datetime
-import pytz
 import tempfile
 from getpass import getuser
 import random
@@ -15,13 +15,20 @@ from firexkit.permissions import DEFAULT_CHMOD_MODE
 
 BASE_LOGGING_DIR_ENV_VAR_KEY = 'firex_base_logging_dir'
 
+# pkg_resources.resource_filename('firexkit', 'resources') would have been a cleaner way, but
+# pkg_reources is very slow to load
+_FIREXKIT_RESOURCES_DIR = os.path.join(os.path.dirname(firexkit.__file__), 'resources')
+
 FIREX_ID_DATE_FMT = "%y%m%d-%H%M%S"
 ALL_FIREX_IDS_REGEX = re.compile(r'(FireX-\w+?-\d{6}-\d{6}-\d+)')
 FIREX_ID_REGEX = re.compile(r'^FireX-(?P<user>.*?)-(?P<datetime_str>\d{6}-\d{6})-(?P<random_int>\d+)$')
 
 
 def firex_id_str(user: str, timestamp: datetime.datetime, random_int: int) -> str:
-    return f'FireX-{user}-{timestamp.strftime(FIREX_ID_DATE_FMT)}-{random_int}'
+    # Formats the timestamp like strftime(FIREX_ID_DATE_FMT), without parsing the format on every call.
+    t = timestamp
+    return (f'FireX-{user}-{t.year % 100:02d}{t.month:02d}{t.day:02d}-{t.hour:02d}{t.minute:02d}{t.second:02d}'
+            f'-{random_int}')
 
 
 @dataclass(frozen=True)
@@ -34,36 +41,63 @@ class FireXIdParts:
         return firex_id_str(self.user, self.timestamp, self.random_int)
 
 
+@lru_cache(maxsize=1)
+def _get_user() -> str:
+    # constant for the life of the process
+    return getuser()
+
+
+def _parse_firex_id_datetime_str(datetime_str: str) -> Optional[datetime.datetime]:
+    # Equivalent to strptime with FIREX_ID_DATE_FMT on the regex-validated 'yymmdd-HHMMSS', minus the format parsing.
+    try:
+        yy = int(datetime_str[0:2])
+        return datetime.datetime(yy + (2000 if yy < 69 else 1900),  # %y pivot
+                                 int(datetime_str[2:4]), int(datetime_str[4:6]),
+                                 int(datetime_str[7:9]), int(datetime_str[9:11]), int(datetime_str[11:13]),
+                                 tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None # invalidate date format.
+
+
+# 'FireX-' + '-' + 'yymmdd-HHMMSS' + '-' + at least one digit, with an empty user.
+_MIN_FIREX_ID_LEN = 22
+
+
+def _may_be_firex_id(maybe_firex_id: str) -> bool:
+    # cheap rejection of most non-ids before running the regex
+    return bool(maybe_firex_id) and len(maybe_firex_id) >= _MIN_FIREX_ID_LEN and maybe_firex_id.startswith('FireX-')
+
+
 def get_firex_id_parts(maybe_firex_id: str) -> Optional[FireXIdParts]:
+    if not _may_be_firex_id(maybe_firex_id):
+        return None
     m = FIREX_ID_REGEX.match(maybe_firex_id)
     if m:
-        parts = m.groupdict()
-        try:
-             tz_unaware_datetime = datetime.datetime.strptime(
-                parts['datetime_str'],
-                FIREX_ID_DATE_FMT)
-        except ValueError:
-            pass # invalidate date format.
-        else:
-            tz_aware_datetime = pytz.utc.localize(tz_unaware_datetime)
-            return FireXIdParts(parts['user'], tz_aware_datetime, int(parts['random_int']))
+        user, datetime_str, random_int = m.group('user', 'datetime_str', 'random_int')
+        tz_aware_datetime = _parse_firex_id_datetime_str(datetime_str)
+        if tz_aware_datetime:
+            return FireXIdParts(user, tz_aware_datetime, int(random_int))
     return None
 
 
 def is_firex_id(maybe_firex_id: str) -> bool:
-    return bool(get_firex_id_parts(maybe_firex_id))
+    # Same validation as get_firex_id_parts, without building the parts.
+    if not _may_be_firex_id(maybe_firex_id):
+        return False
+    m = FIREX_ID_REGEX.match(maybe_firex_id)
+    return bool(m) and _parse_firex_id_datetime_str(m.group('datetime_str')) is not None
 
 
 def find_all_firex_ids_from_str(input_str) -> list[str]:
-    if not input_str:
+    if not input_str or 'FireX-' not in input_str:
         return []
     # unique, keeping order from input.
-    return list(
-        {
-        fid: None
-        for fid in ALL_FIREX_IDS_REGEX.findall(input_str)
-        }.keys()
-    )
+    return list(dict.fromkeys(ALL_FIREX_IDS_REGEX.findall(input_str)))
+
+
+def _copy_with_open_permissions(src, dst):
+    shutil.copyfile(src, dst)
+    os.chmod(dst, DEFAULT_CHMOD_MODE)
 
 
 class Uid(object):
@@ -71,65 +105,54 @@ class Uid(object):
     _resources_dirname = os.path.join(debug_dirname, 'resources')
 
     def __init__(self, identifier=None, firex_requester=None):
-        self.timestamp = datetime.datetime.now(tz=pytz.utc)
-        self.user = getuser()
+        self.timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.user = _get_user()
         self.firex_requester = firex_requester or self.user
         if identifier:
             self.identifier = identifier
         else:
-            random.seed()
+            # the random module is seeded from system entropy at import, and reseeded in forked children
             self.identifier = firex_id_str(self.user, self.timestamp, random.randint(1, 65536))
-        self._base_logging_dir = None
-        self._logs_dir = None
         self._debug_dir = None
         self._viewers = {}
 
-    @property
+    @cached_property
     def base_logging_dir(self):
-        if not self._base_logging_dir:
-            self._base_logging_dir = os.environ.get(BASE_LOGGING_DIR_ENV_VAR_KEY, tempfile.gettempdir())
-        return self._base_logging_dir
+        return os.environ.get(BASE_LOGGING_DIR_ENV_VAR_KEY, tempfile.gettempdir())
 
-    @property
+    @cached_property
     def logs_dir(self):
-        if not self._logs_dir:
-            self._logs_dir = self.create_logs_dir()
-            self._debug_dir = self.create_debug_dir()
-            self.copy_resources()
-        return self._logs_dir
+        logs_dir = self.create_logs_dir()
+        # pass the new paths explicitly, since the logs_dir property isn't set until this returns
+        self._debug_dir = self.create_debug_dir(logs_dir)
+        self.copy_resources(self.get_resources_path(logs_dir))
+        return logs_dir
 
-    @property
+    @cached_property
     def debug_dir(self):
-        if not self._debug_dir:
-            self._debug_dir = self.create_debug_dir()
+        _ = self.logs_dir  # the debug dir is created along with the logs dir
         return self._debug_dir
 
     @classmethod
     def get_resources_path(cls, logs_dir):
         return os.path.join(logs_dir, cls._resources_dirname)
 
-    @property
+    @cached_property
     def resources_dir(self):
         return self.get_resources_path(self.logs_dir)
 
     def _create_logs_dir_from_base(self, base_logging_dir):
         path = os.path.join(base_logging_dir, self.identifier)
-        try:
-            os.makedirs(path)
-        except FileExistsError:
-            pass
+        os.makedirs(path, exist_ok=True)
         return path
 
     def create_logs_dir(self):
         return self._create_logs_dir_from_base(self.base_logging_dir)
 
-    def create_debug_dir(self):
-        path = os.path.join(self.logs_dir, self.debug_dirname)
-        try:
-            os.makedirs(path)
-        except FileExistsError:
-            # Could have been created by other dependencies (e.g. redis)
-            pass
+    def create_debug_dir(self, logs_dir=None):
+        path = os.path.join(logs_dir or self.logs_dir, self.debug_dirname)
+        # Could have been created by other dependencies (e.g. redis)
+        os.makedirs(path, exist_ok=True)
         return path
 
     def __str__(self):
@@ -139,18 +162,21 @@ class Uid(object):
         return self.identifier
 
     def __eq__(self, other):
+        if isinstance(other, Uid):
+            return other.identifier == self.identifier
+        if isinstance(other, str):
+            return other == self.identifier
         return str(other) == self.identifier
 
-    def copy_resources(self):
-        # pkg_resources.resource_filename('firexkit', 'resources') would have been a cleaner way, but
-        # pkg_reources is very slow to load
-        pkg_resource_dir = os.path.join(os.path.dirname(firexkit.__file__), 'resources')
-        resources_dir = self.resources_dir
-        shutil.copytree(pkg_resource_dir, resources_dir)
-        # Open permissions
-        os.chmod(self.resources_dir, DEFAULT_CHMOD_MODE)
-        for file in os.listdir(resources_dir):
-            os.chmod(os.path.join(resources_dir, file), DEFAULT_CHMOD_MODE)
+    def __hash__(self):
+        # consistent with equality to the identifier string
+        return hash(self.identifier)
+
+    def copy_resources(self, resources_dir=None):
+        resources_dir = resources_dir or self.resources_dir
+        # Open permissions as each file is copied, rather than copying the source's and then walking the copy
+        shutil.copytree(_FIREXKIT_RESOURCES_DIR, resources_dir, copy_function=_copy_with_open_permissions)
+        os.chmod(resources_dir, DEFAULT_CHMOD_MODE)
 
     def add_viewers(self, **attrs):
         self._viewers.update(**attrs)
@@ -24,7 +24,7 @@ def CopyBogKeys(self: FireXTask, bog_key_map: dict, strict: bool = False):
     """
 
     logger.debug('abog content: %r' % self.abog)
-    flame_status = ""
+    status_strs = []
 
     new = {}
     for existing_bog_key, new_key in bog_key_map.items():
@@ -38,10 +38,10 @@ def CopyBogKeys(self: FireXTask, bog_key_map: dict, strict: bool = False):
             new[new_key] = existing_value
             status_str = f'{existing_bog_key}={new_key}'
             logger.debug('BOG mapping: ' + status_str)
-            if flame_status:
-                flame_status += '<BR>'
-            flame_status += status_str
-            self.send_firex_html(status=flame_status)
+            status_strs.append(status_str)
+
+    if status_strs:
+        self.send_firex_html(status='<BR>'.join(status_strs))
 
     return new
 
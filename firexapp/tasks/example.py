@@ -10,6 +10,9 @@ from firexapp.engine.celery import app
 from firexapp.submit.arguments import InputConverter
 from firexapp.tasks.core_tasks import CopyBogKeys
 
+# constant for the life of the worker
+_USER = getuser()
+
 
 @app.task
 def nop() -> None:
@@ -19,18 +22,19 @@ def nop() -> None:
 @app.task
 def sleep(sleep: Optional[int] = None) -> None:
     if sleep:
-        time.sleep(int(sleep))
+        # CLI values arrive as strings
+        time.sleep(sleep if isinstance(sleep, int) else int(sleep))
     return
 
 
 @app.task(returns='username')
 def getusername() -> str:
-    return getuser()
+    return _USER
 
 
 # The @app.task() makes this normal python function a FireX Service.
 @app.task(returns=['greeting'], flame=['greeting'])
-def greet(name: str = getuser()) -> str:
+def greet(name: str = _USER) -> str:
     assert len(name) > 1, "Cannot greet a name with 1 or fewer characters."
     return 'Hello %s!' % name
 
@@ -73,19 +77,22 @@ def amplify(to_amplify: str,
             surround_str: Optional[str] = None,
             underline_char: Optional[str] = None,
             overline_char: Optional[str] = None) -> str:
-    result = to_amplify
+    centerline = to_amplify
     if upper:
-        result = to_amplify.upper()
+        centerline = to_amplify.upper()
     if surround_str:
-        result = surround_str + result + surround_str
-    centerline_len = len(result)
+        centerline = f'{surround_str}{centerline}{surround_str}'
+    centerline_len = len(centerline)
+
+    # build the lines once and join them, rather than re-copying the result for each added line
+    lines = [centerline]
     if underline_char:
-        result = result + '\n' + (underline_char * centerline_len)
+        lines.append(underline_char * centerline_len)
 
     if overline_char:
-        result = (overline_char * centerline_len) + '\n' + result
+        lines.insert(0, overline_char * centerline_len)
 
-    return result
+    return '\n'.join(lines)
 
 
 def _amplified_greeting_formatter(args_and_maybe_results: dict) -> str:
@@ -116,14 +123,16 @@ def amplified_greet_guests(self: FireXTask, guests: list[str]) -> str:
     return chain_results['amplified_message']
 
 
+_SPRINGFIELD_POWER_PLANT_JOB_TITLES = {'Charles Montgomery Burns': 'OWNER',
+                                       'Waylon Smithers': 'EXECUTIVE ASSISTANT',
+                                       'Lenny Leonard': 'DIRECTOR',
+                                       'Homer Simpson': 'SUPERVISOR'}
+
+
 @app.task()
 @returns('job_title')
 def get_springfield_power_plant_job_title(name):
-    username_to_title = {'Charles Montgomery Burns': 'OWNER',
-                         'Waylon Smithers': 'EXECUTIVE ASSISTANT',
-                         'Lenny Leonard': 'DIRECTOR',
-                         'Homer Simpson': 'SUPERVISOR'}
-    return username_to_title.get(name, 'UNKNOWN')
+    return _SPRINGFIELD_POWER_PLANT_JOB_TITLES.get(name, 'UNKNOWN')
 
 
 @InputConverter.register
@@ -134,10 +143,12 @@ def employee_names_to_list(employee_names):
 
 @app.task(bind=True, returns=['amplified_greeting'])
 def greet_springfield_power_plant_employees(self, employee_names):
-    names_with_titles = []
-    for name in employee_names:
-        job_title = self.enqueue_child_and_get_results(get_springfield_power_plant_job_title.s(name=name))['job_title']
-        names_with_titles.append(f"{job_title} {name}")
+    # Enqueue all the job title lookups before waiting on any of them, so they run in parallel.
+    title_promises = [self.enqueue_child(get_springfield_power_plant_job_title.s(name=name))
+                      for name in employee_names]
+    self.wait_for_children()
+    names_with_titles = [f"{promise.result['job_title']} {name}"
+                         for promise, name in zip(title_promises, employee_names)]
 
     results = self.enqueue_child_and_get_results(amplified_greet_guests.s(guests=names_with_titles))
     return results['amplified_greeting']
@@ -1,5 +1,4 @@
-import os
-
+from functools import lru_cache
 from importlib import import_module
 from celery import bootsteps
 from celery.signals import task_postrun
@@ -8,7 +7,7 @@ from celery.utils.log import get_task_logger
 from firexkit.chain import InjectArgs
 from firexkit.result import find_unsuccessful_in_chain, get_results, RUN_RESULTS_NAME, RUN_UNSUCCESSFUL_NAME
 
-from firexapp.application import get_app_tasks
+from firexapp.application import get_app_tasks, build_chain
 from firexapp.engine.celery import app
 
 logger = get_task_logger(__name__)
@@ -30,9 +29,7 @@ def backend_get_root_revoked():
 # noinspection PyPep8Naming
 @app.task(bind=True, returns=(RUN_RESULTS_NAME, RUN_UNSUCCESSFUL_NAME))
 def RootTask(self, chain, **chain_args):
-    c = InjectArgs(chain=chain, **chain_args)
-    for task in get_app_tasks(chain):
-        c |= task.s()
+    c = build_chain(InjectArgs(chain=chain, **chain_args), get_app_tasks(chain))
     promise = self.enqueue_child(c, block=True, raise_exception_on_failure=False)
     chain_results = get_results(promise)
     unsuccessful_services = find_unsuccessful_in_chain(promise)
@@ -41,11 +38,14 @@ def RootTask(self, chain, **chain_args):
 
 def get_configured_root_task():
     # determine the configured root_task
-    root_task_long_name = app.conf.get("root_task")
-    root_module_name, root_task_name = os.path.splitext(root_task_long_name)
+    return _get_root_task(app.conf.get("root_task"))
+
+
+@lru_cache(maxsize=1)
+def _get_root_task(root_task_long_name):
+    root_module_name, _, root_task_name = root_task_long_name.rpartition('.')
     if root_module_name != __name__:
         # Root task has been overridden
-        root_task_name = root_task_name.lstrip(".")
         root_module = import_module(root_module_name)
         return getattr(root_module, root_task_name)
     else:
@@ -78,7 +78,7 @@ def handle_firex_root_completion(sender, task, task_id, args, kwargs, **do_not_c
 
     # Let this signal cause self-destruct
     submit_app.self_destruct(chain_details=(result, kwargs),
-                             reason=f'Root task completion ({result.state}) detected via postrun signal.',
+                             reason=f'Root task completion ({result_state}) detected via postrun signal.',
                              run_revoked=is_revoked)
 
     logger.info("Root task post run signal completed")
@@ -1,6 +1,7 @@
 import os
 import abc
 import sys
+import stat
 import inspect
 from importlib import import_module
 from typing import Optional
@@ -98,35 +99,66 @@ def discover_tests(tests, config_filter="") -> list:
 
 def import_test_configs(path) -> []:
     # dynamically load module
-    if not os.path.exists(path):
+    try:
+        mode = os.stat(path).st_mode  # a single stat, rather than separate exists/isfile/isdir checks
+    except FileNotFoundError:
         raise FileNotFoundError(path)
-    if (__file__ in path or
+    if stat.S_ISREG(mode):
+        return _import_test_configs_from_file(path)
+    elif stat.S_ISDIR(mode):
+        return _import_test_configs_from_dir(path)
+    return []
+
+
+_RESULTS_FOLDER = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "results"))
+
+
+def _is_ignored_test_path(path) -> bool:
+    return (__file__ in path or
             "pycache" in path or  # We don't need to look at the cache
-            os.path.basename(path) == "data"):  # By convention, a "data" directory will contain artifacts for the tests
+            os.path.basename(path) == "data")  # By convention, a "data" directory will contain artifacts for the tests
+
+
+def _import_test_configs_from_file(path) -> []:
+    if _is_ignored_test_path(path):
+        return []
+    if os.path.splitext(path)[1] != ".py":
+        return []
+    if os.path.basename(__file__) == os.path.basename(path):
+        return []
+
+    module_dir = os.path.dirname(os.path.abspath(path))
+    # Only add each test directory once; duplicate sys.path entries slow down every later import.
+    if module_dir not in sys.path:
+        sys.path.append(module_dir)
+    module = import_module(os.path.splitext(os.path.basename(path))[0])
+
+    config_objects = []
+    # sorted by name, like inspect.getmembers, without getattr'ing every name in dir(module)
+    for _, obj in sorted(vars(module).items()):
+        if not inspect.isclass(obj) or obj.__module__ != module.__name__:
+            continue
+        # match base classes by name, in case this module was loaded more than once
+        if any(cls.__name__ == FlowTestConfiguration.__name__ for cls in obj.__mro__[1:]) and \
+                not inspect.isabstract(obj) and '__metaclass__' not in obj.__dict__:
+            config_object = obj()
+            config_object.filepath = path
+            config_objects.append(config_object)
+    return config_objects
+
+
+def _import_test_configs_from_dir(path) -> []:
+    if _is_ignored_test_path(path):
+        return []
+    if os.path.normpath(path) == _RESULTS_FOLDER:
         return []
 
     config_objects = []
-    if os.path.isfile(path):
-        if os.path.splitext(path)[1] != ".py":
-            return []
-        if os.path.basename(__file__) == os.path.basename(path):
-            return []
-
-        sys.path.append(os.path.dirname(os.path.abspath(path)))
-        module = import_module(os.path.splitext(os.path.basename(path))[0])
-
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if FlowTestConfiguration.__name__ in [cls.__name__ for cls in inspect.getmro(obj)[1:]] and \
-                            not inspect.isabstract(obj) and '__metaclass__' not in obj.__dict__ and \
-                            obj.__module__ == module.__name__:
-                config_object = obj()
-                config_object.filepath = path
-                config_objects.append(config_object)
-
-    elif os.path.isdir(path):
-        results_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
-        if os.path.normpath(path) == os.path.normpath(results_folder):
-            return []
-        for sub_path in [os.path.join(path, f) for f in os.listdir(path)]:
-            config_objects += import_test_configs(sub_path)
+    # scandir's entries already know their type, so children aren't stat'ed again to decide how to handle them
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                config_objects += _import_test_configs_from_file(entry.path)
+            elif entry.is_dir():
+                config_objects += _import_test_configs_from_dir(entry.path)
     return config_objects
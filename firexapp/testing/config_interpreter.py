@@ -2,8 +2,10 @@ import sys
 import time
 import os
 import inspect
+import pickle
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List
 import tempfile
 
@@ -16,6 +18,40 @@ from firexapp.submit.install_configs import load_new_install_configs, INSTALL_CO
 from firexapp.testing.config_base import InterceptFlowTestConfiguration, FlowTestConfiguration
 
 
+# module source for the mock service generated for intercept flow tests
+_INTERCEPT_TASK_TEMPLATE = """
+import os
+import pickle
+from celery import current_app as app
+from firexkit.task import FireXTask
+
+
+# noinspection PyPep8Naming
+@app.task(base=FireXTask)
+def {0}(**kwargs):
+    local_stuff = locals()
+    local_stuff.update(kwargs)
+
+    def str_default(o):
+        return str(o)
+    from helper import str2file
+    file_path = "{1}"
+    dir_path = os.path.dirname(file_path)
+    if not os.path.isdir(dir_path):
+        os.makedirs(dir_path)
+    with open(file_path, "wb") as f:
+        pickle.dump(local_stuff, f)
+    if not os.path.isfile(file_path):
+        raise Exception("Could not create result files")
+"""
+
+
+@lru_cache(maxsize=None)
+def _get_class_file(cls) -> str:
+    # the source file of a test config class doesn't change, and is needed both for --plugins and for reporting
+    return inspect.getfile(cls)
+
+
 class ConfigInterpreter:
     execution_directory = None
 
@@ -38,39 +74,14 @@ class ConfigInterpreter:
 
     @staticmethod
     def is_instance_of_intercept(test_config: FlowTestConfiguration):
-        base_classes = [cls.__name__ for cls in inspect.getmro(type(test_config))[1:]]
-        return InterceptFlowTestConfiguration.__name__ in base_classes
+        # matched by name, like test config discovery, rather than with isinstance
+        return any(cls.__name__ == InterceptFlowTestConfiguration.__name__ for cls in type(test_config).__mro__[1:])
 
     @staticmethod
     def create_mock_file(results_folder, results_file, test_name, intercept_microservice):
         mock_file_name = test_name + "_mock.py"
         mock_file = os.path.join(results_folder, mock_file_name)
-        intercept_task = """
-import os
-from celery import current_app as app
-from firexkit.task import FireXTask
-
-
-# noinspection PyPep8Naming
-@app.task(base=FireXTask)
-def {0}(**kwargs):
-    local_stuff = locals()
-    local_stuff.update(kwargs)
-    import pickle
-
-    def str_default(o):
-        return str(o)
-    from helper import str2file
-    file_path = "{1}"
-    dir_path = os.path.dirname(file_path)
-    if not os.path.isdir(dir_path):
-        os.makedirs(dir_path)
-    with open(file_path, "wb") as f:
-        pickle.dump(local_stuff, f)
-    if not os.path.isfile(file_path):
-        raise Exception("Could not create result files")
-    """
-        content = intercept_task.format(intercept_microservice, results_file)
+        content = _INTERCEPT_TASK_TEMPLATE.format(intercept_microservice, results_file)
         if not os.path.isdir(results_folder):
             os.mkdir(results_folder)
         with open(mock_file, "w") as f:
@@ -141,7 +152,7 @@ def {0}(**kwargs):
 
     def collect_plugins(self, flow_test_config)->[]:
         # add test file and dynamically generated files to --plugins
-        test_src_file = inspect.getfile(flow_test_config.__class__)
+        test_src_file = _get_class_file(flow_test_config.__class__)
         plugins = [
             os.path.realpath(test_src_file),  # must be first to be imported
         ]
@@ -174,7 +185,7 @@ def {0}(**kwargs):
     def run_executable(self, cmd, flow_test_config):
 
         # print useful links
-        test_src_file = inspect.getfile(flow_test_config.__class__)
+        test_src_file = _get_class_file(flow_test_config.__class__)
         if hasattr(flow_test_config, 'logs_link'):
             print("\tLogs:", self.document_viewer(flow_test_config.logs_link))
         print("\tTest source:", self.document_viewer(test_src_file))
@@ -186,13 +197,21 @@ def {0}(**kwargs):
 
         # run firex
         try:
-            with open(flow_test_config.std_out, 'w') as std_out_f, open(flow_test_config.std_err, 'w') as std_err_f:
+            with open(flow_test_config.std_out, 'w+') as std_out_f, \
+                    open(flow_test_config.std_err, 'w+') as std_err_f:
                 start_time = time.monotonic()
                 process = subprocess.Popen(cmd, stdout=std_out_f, stderr=std_err_f,
                                            universal_newlines=True, shell=False, cwd=self.execution_directory,
                                            env=os.environ | flow_test_config.get_extra_run_env())
                 _, _ = process.communicate(timeout=getattr(flow_test_config, "timeout", None))
                 elapsed_time = time.monotonic() - start_time
+                # read the output back through the same handles instead of re-opening the files for verification
+                std_out_f.seek(0)
+                std_out = std_out_f.read()
+                std_err_f.seek(0)
+                # filter stderr line by line rather than reading, splitting and filtering whole-output copies
+                std_err = "\n".join(line for line in (raw_line.rstrip("\n") for raw_line in std_err_f)
+                                     if line and not line.startswith("pydev debugger:"))
 
             verification_start_time = time.monotonic()
             # check for expected return code
@@ -211,15 +230,11 @@ def {0}(**kwargs):
                 if not os.path.isfile(intercept_results_file):
                     raise FileNotFoundError(intercept_results_file + " was not found. Could not retrieve results.")
 
-                import pickle
                 with open(intercept_results_file, 'rb') as results_file_f:
                     captured_options = pickle.load(results_file_f)
                 flow_test_config.assert_expected_options(captured_options)
 
-            with open(flow_test_config.std_out, 'r') as std_out_f, open(flow_test_config.std_err, 'r') as std_err_f:
-                errors = std_err_f.read().split("\n")
-                errors = [line for line in errors if line and not line.startswith("pydev debugger:")]
-                flow_test_config.assert_expected_firex_output(std_out_f.read(), "\n".join(errors))
+            flow_test_config.assert_expected_firex_output(std_out, std_err)
             verification_time = time.monotonic() - verification_start_time
         except (subprocess.TimeoutExpired, KeyboardInterrupt) as e:
             elapsed_time = getattr(e, 'timeout', None)
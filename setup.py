@@ -27,12 +27,10 @@ setup(name='firexapp',
           "hiredis",
           "celery[redis]==5.3.1",
           "psutil",
-          "python-Levenshtein",
           "entrypoints",
           "colorlog==2.10.0",
           "beautifulsoup4",
           "detach3k",
-          "pytz",
           "rapidfuzz==3.8.1",  # 3.9.1 is broken (seg faults)
       ],
       extras_require={
@@ -1,6 +1,9 @@
 import os
 import shutil
+import time
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
 from celery import Celery
 from firexapp.application import FireXBaseApp, JSON_ARGS_PATH_ARG_NAME
@@ -70,6 +73,15 @@ class SubmitArgsTests(unittest.TestCase):
             with self.assertRaises(Exception):
                 main.run(sys_argv=[JSON_ARGS_PATH_ARG_NAME])
 
+    def test_get_log_dir_from_output(self):
+        # imported here, since importing the submit module at collection time affects other test modules
+        from firexapp.submit.submit import get_log_dir_from_output
+        self.assertEqual(get_log_dir_from_output(""), "")
+        self.assertEqual(get_log_dir_from_output("nothing\nhere"), "")
+        output = "FireX ID: FireX-a\nLogs: /tmp/first\nother\nLogs: /tmp/last \ndone"
+        self.assertEqual(get_log_dir_from_output(output), "/tmp/last")
+        self.assertEqual(get_log_dir_from_output("Logs: /tmp/only"), "/tmp/only")
+
 
 class InputConversionTests(unittest.TestCase):
     def setUp(self):
@@ -155,6 +167,19 @@ class InputConversionTests(unittest.TestCase):
         InputConverter.convert(pre_load=True, **{})
         self.assertEqual(len(InputConverter.convert(pre_load=False, **{})), 1)
 
+    def test_no_converters(self):
+        self.assertFalse(InputConverter.has_converters(pre_load=True))
+        data = {"a": "true"}
+        self.assertEqual(InputConverter.convert(**data), data)
+        self.assertTrue(InputConverter.pre_load_was_run)
+
+        @InputConverter.register
+        def post(_):
+            return {"a": True}
+
+        self.assertTrue(InputConverter.has_converters())
+        self.assertEqual(InputConverter.convert(**data), {"a": True})
+
     def test_default_boolean_converter(self):
         self.assertTrue(convert_booleans.__name__ in self.old.get_visit_order(pre_task=True))
         e = []
@@ -313,6 +338,9 @@ class UidTests(unittest.TestCase):
         self.assertEqual(str(uid), test_str)
         self.assertEqual(repr(uid), test_str)
         self.assertEqual(uid.identifier, test_str)
+        self.assertEqual(uid, Uid(test_str))
+        self.assertNotEqual(uid, Uid("goodbye"))
+        self.assertIn(test_str, {uid})
         shutil.rmtree(uid.logs_dir)
 
     def test_logs_creation(self):
@@ -320,3 +348,148 @@ class UidTests(unittest.TestCase):
         self.assertTrue(os.path.isdir(uid.logs_dir))
         self.assertTrue(os.path.isdir(uid.debug_dir))
         shutil.rmtree(uid.logs_dir)
+
+    def test_logs_creation_hooks(self):
+        calls = []
+
+        class HookedUid(Uid):
+            def create_debug_dir(self, logs_dir=None):
+                calls.append('create_debug_dir')
+                return super().create_debug_dir(logs_dir)
+
+            def copy_resources(self, resources_dir=None):
+                calls.append('copy_resources')
+                super().copy_resources(resources_dir)
+
+        uid = HookedUid()
+        self.assertTrue(os.path.isdir(uid.debug_dir))
+        self.assertTrue(os.path.isdir(uid.resources_dir))
+        self.assertEqual(['create_debug_dir', 'copy_resources'], calls)
+        shutil.rmtree(uid.logs_dir)
+
+
+class TrackingServiceStartTests(unittest.TestCase):
+
+    @staticmethod
+    def _start_tracking_services(parallel: bool) -> dict:
+        from firexapp.submit.submit import SubmitBaseApp
+        from firexapp.submit.tracking_service import TrackingService, PARALLEL_TRACKING_START_ENV_NAME
+
+        class SlowService(TrackingService):
+            def start(self, args, install_configs, **kwargs):
+                time.sleep(0.1)  # finishes last when started concurrently
+                return {'shared': 'slow', 'slow': 1}
+
+        class FastService(TrackingService):
+            def start(self, args, install_configs, **kwargs):
+                return {'shared': 'fast', 'fast': 2}
+
+        app = SubmitBaseApp()
+        app.install_configs = SimpleNamespace(raw_configs=SimpleNamespace(requested_tracking_services=None))
+        args = SimpleNamespace(disable_tracking_services='')
+        with mock.patch('firexapp.submit.submit.get_tracking_services', return_value=(SlowService(), FastService())), \
+                mock.patch.dict(os.environ):
+            os.environ.pop(PARALLEL_TRACKING_START_ENV_NAME, None)
+            if parallel:
+                os.environ[PARALLEL_TRACKING_START_ENV_NAME] = '1'
+            return app.start_tracking_services(args)
+
+    def test_parallel_start_merges_in_service_order(self):
+        serial = self._start_tracking_services(parallel=False)
+        parallel = self._start_tracking_services(parallel=True)
+        self.assertEqual({'shared': 'fast', 'slow': 1, 'fast': 2}, serial)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(list(serial), list(parallel))
+
+
+class TrackingServiceLoadTests(unittest.TestCase):
+
+    @staticmethod
+    def _load(entry_pts, parallel: bool) -> list:
+        from entrypoints import EntryPoint
+        from firexapp.submit.tracking_service import _load_entry_points, PARALLEL_TRACKING_LOAD_ENV_NAME
+
+        def slow_first_load(ep):
+            # earlier entry points finish loading last when loaded concurrently
+            time.sleep(0.02 * (len(entry_pts) - int(ep.name)))
+            return ep.name
+
+        with mock.patch.object(EntryPoint, 'load', autospec=True, side_effect=slow_first_load), \
+                mock.patch.dict(os.environ):
+            os.environ.pop(PARALLEL_TRACKING_LOAD_ENV_NAME, None)
+            if parallel:
+                os.environ[PARALLEL_TRACKING_LOAD_ENV_NAME] = '1'
+            return _load_entry_points(entry_pts)
+
+    def test_parallel_load_keeps_entry_point_order(self):
+        from entrypoints import EntryPoint
+        entry_pts = [EntryPoint(str(i), 'fake_tracking_service', 'Service') for i in range(5)]
+        expected = [ep.name for ep in entry_pts]
+        self.assertEqual(expected, self._load(entry_pts, parallel=False))
+        self.assertEqual(expected, self._load(entry_pts, parallel=True))
+
+
+class BackendSetManyTests(unittest.TestCase):
+
+    @staticmethod
+    def _redis_backend(expires):
+        from celery.backends.redis import RedisBackend
+        backend = Celery(backend='redis://localhost:1/0').backend
+        assert isinstance(backend, RedisBackend)
+        backend.expires = expires
+        backend.client = mock.MagicMock()
+        return backend
+
+    def test_non_redis_backend_falls_back_to_set(self):
+        from firexapp.submit.submit import backend_set_many
+        backend = Celery(backend='cache+memory://').backend
+        with mock.patch.object(backend, 'set', wraps=backend.set) as set_spy:
+            backend_set_many(backend, {'uid': 'FireX-a', 'logs_dir': '/tmp/a'})
+        self.assertEqual([mock.call('uid', 'FireX-a'), mock.call('logs_dir', '/tmp/a')], set_spy.call_args_list)
+        self.assertEqual('/tmp/a', backend.get('logs_dir'))
+
+    def test_redis_backend_writes_in_one_pipeline(self):
+        from firexapp.submit.submit import backend_set_many
+        for expires in [None, 60]:
+            with self.subTest(expires=expires):
+                backend = self._redis_backend(expires)
+                backend_set_many(backend, {'uid': 'FireX-a', 'logs_dir': '/tmp/a'})
+
+                pipe = backend.client.pipeline.return_value.__enter__.return_value
+                if expires:
+                    expected_writes = [mock.call.setex('uid', expires, 'FireX-a'),
+                                       mock.call.publish('uid', 'FireX-a'),
+                                       mock.call.setex('logs_dir', expires, '/tmp/a'),
+                                       mock.call.publish('logs_dir', '/tmp/a')]
+                else:
+                    expected_writes = [mock.call.set('uid', 'FireX-a'),
+                                       mock.call.publish('uid', 'FireX-a'),
+                                       mock.call.set('logs_dir', '/tmp/a'),
+                                       mock.call.publish('logs_dir', '/tmp/a')]
+                self.assertEqual(1, backend.client.pipeline.call_count)
+                self.assertEqual(expected_writes + [mock.call.execute()], pipe.method_calls)
+
+    def test_redis_backend_oversized_value_writes_nothing(self):
+        from celery.exceptions import BackendStoreError
+        from firexapp.submit.submit import backend_set_many
+        backend = self._redis_backend(None)
+        backend._MAX_STR_VALUE_SIZE = 8  # rather than allocating a value over Redis' real 512MB limit
+        with self.assertRaises(BackendStoreError):
+            backend_set_many(backend, {'uid': 'FireX-a', 'too_large': 'x' * 9})
+        backend.client.pipeline.assert_not_called()
+
+
+class WriteJsonObjectItemsTests(unittest.TestCase):
+
+    def test_matches_sorted_indented_json_dump(self):
+        import io
+        import json
+        from firexapp.submit.submit import write_json_object_items
+        for mapping in [{},
+                        {'PATH': '/usr/bin:/bin'},
+                        {'B_QUOTED': 'say "hi"\\back\tslash\n', 'A_UNICODE': 'caf\u00e9 \u2603',
+                         'C_SURROGATE': 'bad\udcff bytes', 'D_EMPTY': ''}]:
+            with self.subTest(mapping=mapping):
+                written = io.BytesIO()
+                write_json_object_items(written, sorted(mapping.items()))
+                self.assertEqual(json.dumps(mapping, sort_keys=True, indent=4).encode(), written.getvalue())
@@ -1,5 +1,5 @@
 import unittest
-from firexapp.submit.uid import is_firex_id
+from firexapp.submit.uid import is_firex_id, get_firex_id_parts, find_all_firex_ids_from_str
 
 
 class UidTests(unittest.TestCase):
@@ -13,3 +13,22 @@ class UidTests(unittest.TestCase):
         self.assertFalse(is_firex_id('FireX-user-name-220413-233217'))
         self.assertFalse(is_firex_id('FireX-user-220413-233217'))
         self.assertFalse(is_firex_id('FireX-user-220413-233217-'))
+        self.assertFalse(is_firex_id('FireX-user-220432-233217-50289')) # 22/04/32 isn't a day
+        self.assertFalse(is_firex_id(''))
+        self.assertFalse(is_firex_id('Firex-user-220413-233217-50289'))
+
+    def test_get_firex_id_parts(self):
+        parts = get_firex_id_parts('FireX-some-user-220413-233217-50289')
+        self.assertEqual(parts.user, 'some-user')
+        self.assertEqual(parts.random_int, 50289)
+        self.assertEqual(parts.timestamp.isoformat(), '2022-04-13T23:32:17+00:00')
+        self.assertEqual(parts.firex_id(), 'FireX-some-user-220413-233217-50289')
+
+        self.assertIsNone(get_firex_id_parts('FireX-user-220432-233217-50289'))
+
+    def test_find_all_firex_ids_from_str(self):
+        self.assertEqual(find_all_firex_ids_from_str(None), [])
+        self.assertEqual(find_all_firex_ids_from_str('no ids here'), [])
+        self.assertEqual(
+            find_all_firex_ids_from_str('FireX-b-220413-233217-2 and FireX-a-220413-233217-1, FireX-b-220413-233217-2'),
+            ['FireX-b-220413-233217-2', 'FireX-a-220413-233217-1'])